@@ -5,6 +5,10 @@ These are used during semantic analysis of openQASM code
 
 # from openpulse import ast
 
+from collections.abc import KeysView
+from functools import lru_cache
+from itertools import chain
+
 from ...logger import LOGGER
 from .builtin_functions import (
     BUILTIN_OPENPULSE,
@@ -28,6 +32,8 @@ class ScopedSymbolTable:
     Todo consider implementing __getitem__, __setitem__, items() and values() methods
     """
 
+    __slots__ = ("_symbols", "scope_name", "enclosing_scope")
+
     _builtin_symbol_lists = [BUILTIN_TYPES, BUILTIN_ZI_EXP, BUILTIN_ZI_FUNC]
 
     _builtin_functions = []
@@ -46,9 +52,19 @@ class ScopedSymbolTable:
             self._init_builtins()
 
     def _init_builtins(self):
-        for symbol_list in self._builtin_symbol_lists:
-            for symbol in symbol_list:
-                self.insert(symbol)
+        LOGGER.debug("Insert builtin symbols into %s", self.scope_name)
+        self._symbols.update(self._builtin_symbols())
+
+    @classmethod
+    @lru_cache()
+    def _builtin_symbols(cls) -> dict[str, Symbol]:
+        """builtin symbols of the class by name, built once per class and shared,
+        callers must copy the entries rather than modify the returned dictionary"""
+        return {
+            symbol.name: symbol
+            for symbol_list in cls._builtin_symbol_lists
+            for symbol in symbol_list
+        }
 
     def __str__(self) -> str:
         header1 = "SCOPE (SCOPED SYMBOL TABLE)"
@@ -113,7 +129,7 @@ class ScopedSymbolTable:
             return self.enclosing_scope.lookup(name)
         return None
 
-    def keys(self, current_scope_only=False) -> list[str]:
+    def keys(self, current_scope_only=False) -> KeysView[str]:
         """returns the name of all symbols in scope
 
         Args:
@@ -122,20 +138,13 @@ class ScopedSymbolTable:
                 Defaults to False.
 
         Returns:
-            list[str]: names of all the symbols in scope
+            KeysView[str]:
+                names of all the symbols in scope, names in the current scope first
+                followed by names only found in enclosing scopes
         """
-        symbol_names = list(self._symbols.keys())
-        if current_scope_only:
-            return symbol_names
-        if self.enclosing_scope is not None:
-            symbol_names.extend(
-                [
-                    name
-                    for name in self.enclosing_scope.keys()
-                    if name not in symbol_names
-                ]
-            )
-        return symbol_names
+        if current_scope_only or self.enclosing_scope is None:
+            return self._symbols.keys()
+        return dict.fromkeys(chain(self._symbols, self.enclosing_scope.keys())).keys()
 
 
 class CalScopedSymbolTable(ScopedSymbolTable):
@@ -144,6 +153,8 @@ class CalScopedSymbolTable(ScopedSymbolTable):
     in openQASM programs and using the openPulse defcalgrammar
     """
 
+    __slots__ = ()
+
     _builtin_cal_symbol_lists = [BUILTIN_CAL_TYPES, BUILTIN_OPENPULSE, BUILTIN_ZI_WFM]
 
     def __init__(
@@ -157,6 +168,17 @@ class CalScopedSymbolTable(ScopedSymbolTable):
             self._init_cal_builtins()
 
     def _init_cal_builtins(self):
-        for symbol_list in self._builtin_cal_symbol_lists:
-            for symbol in symbol_list:
-                self.insert(symbol)
+        LOGGER.debug("Insert builtin calibration symbols into %s", self.scope_name)
+        self._symbols.update(self._builtin_cal_symbols())
+
+    @classmethod
+    @lru_cache()
+    def _builtin_cal_symbols(cls) -> dict[str, Symbol]:
+        """builtin calibration symbols of the class by name, built once per class
+        and shared, callers must copy the entries rather than modify the returned
+        dictionary"""
+        return {
+            symbol.name: symbol
+            for symbol_list in cls._builtin_cal_symbol_lists
+            for symbol in symbol_list
+        }
@@ -2,7 +2,7 @@ from openpulse import ast
 
 from .generic_transformer import GenericTransformer
 
-# pylint: disable=C0103,W0613,R0904
+# pylint: disable=C0103,C0123,W0613,R0904
 
 
 class CopyTransformer(GenericTransformer):
@@ -26,6 +26,8 @@ class CopyTransformer(GenericTransformer):
         self, node: ast.Statement, context=None
     ) -> list[ast.Annotation]:
         """A statement: anything that can appear on its own line"""
+        if not node.annotations:
+            return []
         return self._visit_list(node.annotations, self.visit)
 
     def visit_Include(
@@ -63,7 +65,7 @@ class CopyTransformer(GenericTransformer):
         """
         return ast.QubitDeclaration(
             qubit=self.visit_Identifier(node.qubit),
-            size=self.visit(node.size) if node.size else None,
+            size=self._visit_optional(node.size),
         )
 
     def visit_QuantumGateDefinition(
@@ -79,10 +81,11 @@ class CopyTransformer(GenericTransformer):
             }
 
         """
+        visit_id = self.visit_Identifier
         return ast.QuantumGateDefinition(
-            name=self.visit_Identifier(node.name),
-            arguments=self._visit_list(node.arguments, self.visit_Identifier),
-            qubits=self._visit_list(node.qubits, self.visit_Identifier),
+            name=visit_id(node.name),
+            arguments=self._visit_list(node.arguments, visit_id),
+            qubits=self._visit_list(node.qubits, visit_id),
             body=self._visit_list(node.body, self.visit),
         )
 
@@ -116,7 +119,7 @@ class CopyTransformer(GenericTransformer):
         return ast.ExternDeclaration(
             name=self.visit_Identifier(node.name),
             arguments=self._visit_list(node.arguments, self.visit),
-            return_type=self.visit(node.return_type) if node.return_type else None,
+            return_type=self._visit_optional(node.return_type),
         )
 
     # def visit_Expression(self, node: ast.Expression, context=None) -> ast.Expression:
@@ -302,15 +305,15 @@ class CopyTransformer(GenericTransformer):
             :
         """
         return ast.RangeDefinition(
-            start=self.visit(node.start) if node.start else None,
-            end=self.visit(node.end) if node.end else None,
-            step=self.visit(node.step) if node.step else None,
+            start=self._visit_optional(node.start),
+            end=self._visit_optional(node.end),
+            step=self._visit_optional(node.step),
         )
 
     IndexElement = ast.DiscreteSet | list[ast.Expression | ast.RangeDefinition]
 
     def _visit_IndexElement(self, node: IndexElement, context=None) -> IndexElement:
-        if isinstance(node, list):
+        if type(node) is list:
             return self._visit_list(node, self.visit)
         return self.visit(node)
 
@@ -374,12 +377,13 @@ class CopyTransformer(GenericTransformer):
             λ // <- argument
             a, b // <- qubit
         """
+        visit = self.visit
         return ast.QuantumGate(
             name=self.visit_Identifier(node.name),
             modifiers=self._visit_list(node.modifiers, self.visit_QuantumGateModifier),
-            arguments=self._visit_list(node.arguments, self.visit),
-            qubits=self._visit_list(node.qubits, self.visit),
-            duration=self.visit(node.duration) if node.duration else None,
+            arguments=self._visit_list(node.arguments, visit),
+            qubits=self._visit_list(node.qubits, visit),
+            duration=self._visit_optional(node.duration),
         )
 
     def visit_QuantumGateModifier(
@@ -400,7 +404,7 @@ class CopyTransformer(GenericTransformer):
         """
         return ast.QuantumGateModifier(
             modifier=node.modifier,
-            argument=self.visit(node.argument) if node.argument else None,
+            argument=self._visit_optional(node.argument),
         )
 
     def visit_QuantumPhase(
@@ -418,10 +422,11 @@ class CopyTransformer(GenericTransformer):
             a // <- qubit
 
         """
+        visit = self.visit
         return ast.QuantumPhase(
             modifiers=self._visit_list(node.modifiers, self.visit_QuantumGateModifier),
-            argument=self.visit(node.argument),
-            qubits=self._visit_list(node.qubits, self.visit),
+            argument=visit(node.argument),
+            qubits=self._visit_list(node.qubits, visit),
         )
 
     # Not a full expression because it can only be used in limited contexts.
@@ -450,7 +455,7 @@ class CopyTransformer(GenericTransformer):
         and returns)."""
         return ast.QuantumMeasurementStatement(
             measure=self.visit_QuantumMeasurement(node.measure),
-            target=self.visit(node.target) if node.target else None,
+            target=self._visit_optional(node.target),
         )
 
     def visit_QuantumBarrier(
@@ -490,7 +495,7 @@ class CopyTransformer(GenericTransformer):
         return ast.ClassicalArgument(
             type=self.visit(node.type),
             name=self.visit_Identifier(node.name),
-            access=self.visit(node.access) if node.access else None,
+            access=self._visit_optional(node.access),
         )
 
     def visit_ExternArgument(
@@ -499,7 +504,7 @@ class CopyTransformer(GenericTransformer):
         """Classical argument for an extern declaration."""
         return ast.ExternArgument(
             type=self.visit(node.type),
-            access=self.visit(node.access) if node.access else None,
+            access=self._visit_optional(node.access),
         )
 
     def visit_ClassicalDeclaration(
@@ -515,9 +520,7 @@ class CopyTransformer(GenericTransformer):
         return ast.ClassicalDeclaration(
             type=self.visit(node.type),
             identifier=self.visit_Identifier(node.identifier),
-            init_expression=self.visit(node.init_expression)
-            if node.init_expression
-            else None,
+            init_expression=self._visit_optional(node.init_expression),
         )
 
     def visit_IODeclaration(
@@ -571,7 +574,7 @@ class CopyTransformer(GenericTransformer):
             int[8]
             int[16]
         """
-        return ast.IntType(size=self.visit(node.size) if node.size else None)
+        return ast.IntType(size=self._visit_optional(node.size))
 
     def visit_UintType(self, node: ast.UintType, context=None) -> ast.UintType:
         """
@@ -583,7 +586,7 @@ class CopyTransformer(GenericTransformer):
             uint[8]
             uint[16]
         """
-        return ast.UintType(size=self.visit(node.size) if node.size else None)
+        return ast.UintType(size=self._visit_optional(node.size))
 
     def visit_FloatType(self, node: ast.FloatType, context=None) -> ast.FloatType:
         """
@@ -595,7 +598,7 @@ class CopyTransformer(GenericTransformer):
             float[16]
             float[64]
         """
-        return ast.FloatType(size=self.visit(node.size) if node.size else None)
+        return ast.FloatType(size=self._visit_optional(node.size))
 
     def visit_ComplexType(self, node: ast.ComplexType, context=None) -> ast.ComplexType:
         """
@@ -607,9 +610,7 @@ class CopyTransformer(GenericTransformer):
             complex[float]
             complex[float[32]]
         """
-        return ast.ComplexType(
-            base_type=self.visit(node.base_type) if node.base_type else None
-        )
+        return ast.ComplexType(base_type=self._visit_optional(node.base_type))
 
     def visit_AngleType(self, node: ast.AngleType, context=None) -> ast.AngleType:
         """
@@ -620,7 +621,7 @@ class CopyTransformer(GenericTransformer):
             angle[8]
             angle[16]
         """
-        return ast.AngleType(size=self.visit(node.size) if node.size else None)
+        return ast.AngleType(size=self._visit_optional(node.size))
 
     def visit_BitType(self, node: ast.BitType, context=None) -> ast.BitType:
         """
@@ -631,7 +632,7 @@ class CopyTransformer(GenericTransformer):
             bit[8]
             creg[8]
         """
-        return ast.BitType(size=self.visit(node.size) if node.size else None)
+        return ast.BitType(size=self._visit_optional(node.size))
 
     def visit_BoolType(self, node: ast.BoolType, context=None) -> ast.BoolType:
         """
@@ -671,7 +672,7 @@ class CopyTransformer(GenericTransformer):
         return ast.ArrayReferenceType(
             base_type=self.visit(node.base_type),
             dimensions=self._visit_list(node.dimensions, self.visit)
-            if isinstance(node.dimensions, list)
+            if type(node.dimensions) is list
             else self.visit(node.dimensions),
         )
 
@@ -731,12 +732,13 @@ class CopyTransformer(GenericTransformer):
                 shift_phase drive(q), -theta;
             }
         """
+        visit = self.visit
         return ast.CalibrationDefinition(
             name=self.visit_Identifier(node.name),
-            arguments=self._visit_list(node.arguments, self.visit),
-            qubits=self._visit_list(node.qubits, self.visit),
-            body=self._visit_list(node.body, self.visit),
-            return_type=self.visit(node.return_type) if node.return_type else None,
+            arguments=self._visit_list(node.arguments, visit),
+            qubits=self._visit_list(node.qubits, visit),
+            body=self._visit_list(node.body, visit),
+            return_type=self._visit_optional(node.return_type),
         )
 
     def visit_SubroutineDefinition(
@@ -753,11 +755,12 @@ class CopyTransformer(GenericTransformer):
                 return measure q;
             }
         """
+        visit = self.visit
         return ast.SubroutineDefinition(
             name=self.visit_Identifier(node.name),
-            arguments=self._visit_list(node.arguments, self.visit),
-            body=self._visit_list(node.body, self.visit),
-            return_type=self.visit(node.return_type) if node.return_type else None,
+            arguments=self._visit_list(node.arguments, visit),
+            body=self._visit_list(node.body, visit),
+            return_type=self._visit_optional(node.return_type),
         )
 
     def visit_QuantumArgument(
@@ -768,7 +771,7 @@ class CopyTransformer(GenericTransformer):
         """
         return ast.QuantumArgument(
             name=self.visit_Identifier(node.name),
-            size=self.visit(node.size) if node.size else None,
+            size=self._visit_optional(node.size),
         )
 
     def visit_ReturnStatement(
@@ -785,7 +788,7 @@ class CopyTransformer(GenericTransformer):
 
         """
         return ast.ReturnStatement(
-            expression=self.visit(node.expression) if node.expression else None,
+            expression=self._visit_optional(node.expression),
         )
 
     def visit_BreakStatement(
@@ -836,10 +839,13 @@ class CopyTransformer(GenericTransformer):
                 ry(-pi / 2) scratch[0];
             } else continue;
         """
+        visit = self.visit
         return ast.BranchingStatement(
-            condition=self.visit(node.condition),
-            if_block=self._visit_list(node.if_block, self.visit),
-            else_block=self._visit_list(node.else_block, self.visit),
+            condition=visit(node.condition),
+            if_block=self._visit_list(node.if_block, visit),
+            else_block=self._visit_list(node.else_block, visit)
+            if node.else_block
+            else [],
         )
 
     def visit_WhileLoop(self, node: ast.WhileLoop, context=None) -> ast.WhileLoop:
@@ -869,11 +875,12 @@ class CopyTransformer(GenericTransformer):
                 majority a[i], b[i + 1], a[i + 1];
             }
         """
+        visit = self.visit
         return ast.ForInLoop(
-            type=self.visit(node.type),
+            type=visit(node.type),
             identifier=self.visit_Identifier(node.identifier),
-            set_declaration=self.visit(node.set_declaration),
-            block=self._visit_list(node.block, self.visit),
+            set_declaration=visit(node.set_declaration),
+            block=self._visit_list(node.block, visit),
         )
 
     def visit_DelayInstruction(
@@ -886,9 +893,10 @@ class CopyTransformer(GenericTransformer):
 
             delay[start_stretch] $0;
         """
+        visit = self.visit
         return ast.DelayInstruction(
-            duration=self.visit(node.duration),
-            qubits=self._visit_list(node.qubits, self.visit),
+            duration=visit(node.duration),
+            qubits=self._visit_list(node.qubits, visit),
         )
 
     def visit_Box(self, node: ast.Box, context=None) -> ast.Box:
@@ -903,7 +911,7 @@ class CopyTransformer(GenericTransformer):
             }
         """
         return ast.Box(
-            duration=self.visit(node.duration) if node.duration else None,
+            duration=self._visit_optional(node.duration),
             body=self._visit_list(node.body, self.visit),
         )
 
@@ -923,7 +931,7 @@ class CopyTransformer(GenericTransformer):
         """``sizeof`` an array's dimensions."""
         return ast.SizeOf(
             target=self.visit(node.target),
-            index=self.visit(node.index) if node.index else None,
+            index=self._visit_optional(node.index),
         )
 
     def visit_AliasStatement(
@@ -1,34 +1,67 @@
 from openpulse import ast
 from openqasm3.visitor import QASMTransformer
 
-# pylint: disable=C0103,W0613,R0904
+# pylint: disable=C0103,C0123,W0613,R0904
 
 
 class GenericTransformer(QASMTransformer):
+    # maps node classes to the (unbound) visitor method used for them, each
+    # subclass gets its own cache so overridden visitors are respected
+    _visitor_cache: dict[type, callable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitor_cache = {}
+
+    def visit(self, node: ast.QASMNode, context=None) -> ast.QASMNode:
+        """
+        Visit a node, dispatching to the 'visit_{node class name}' method of the
+        transformer or to 'generic_visit' if no such method exists.
+
+        The visitor method is looked up once per node class and transformer class
+        and cached, instead of being resolved by name for every visited node.
+        """
+        node_class = type(node)
+        try:
+            visitor = self._visitor_cache[node_class]
+        except KeyError:
+            visitor = getattr(
+                type(self), f"visit_{node_class.__name__}", type(self).generic_visit
+            )
+            self._visitor_cache[node_class] = visitor
+        return visitor(self, node, context) if context else visitor(self, node)
+
     def _visit_list(
         self, nodes: list[ast.QASMNode], visit_function: callable, context=None
     ) -> list[ast.QASMNode]:
         new_nodes = []
+        append = new_nodes.append
         for node in nodes:
             new_node = visit_function(node)
             if new_node:
-                new_nodes.append(new_node)
+                append(new_node)
         return new_nodes
 
     def _visit_list_flatten(
         self, nodes: list[ast.QASMNode], visit_function: callable, context=None
     ) -> list[ast.QASMNode]:
         flat_nodes = []
+        append, extend = flat_nodes.append, flat_nodes.extend
         for node in nodes:
             new_node = visit_function(node)
             if new_node:
-                flat_nodes.extend(
-                    new_node if isinstance(new_node, list) else [new_node]
-                )
+                if type(new_node) is list:
+                    extend(new_node)
+                else:
+                    append(new_node)
         return flat_nodes
 
         # return [node for node in flat_nodes if node]
 
+    def _visit_optional(self, node: ast.QASMNode | None) -> ast.QASMNode | None:
+        """Visit an optional child node, ``None`` is passed through as is"""
+        return None if node is None else self.visit(node)
+
     def visit_Program(self, node: ast.Program, context=None) -> ast.Program:
         """
         An entire OpenQASM 3 program represented by a list of top level statements
@@ -42,7 +75,8 @@ class GenericTransformer(QASMTransformer):
 
     def visit_Statement(self, node: ast.Statement, context=None) -> ast.Statement:
         """A statement: anything that can appear on its own line"""
-        node.annotations = self._visit_list(node.annotations, self.visit)
+        if node.annotations:
+            node.annotations = self._visit_list(node.annotations, self.visit)
         return node
 
     def visit_Include(
@@ -81,7 +115,7 @@ class GenericTransformer(QASMTransformer):
         """
         node = self.visit_Statement(node)
         node.qubit = self.visit_Identifier(node.qubit)
-        node.size = self.visit(node.size) if node.size else None
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_QuantumGateDefinition(
@@ -129,8 +163,7 @@ class GenericTransformer(QASMTransformer):
         node = self.visit_Statement(node)
         node.name = self.visit_Identifier(node.name)
         node.arguments = self._visit_list(node.arguments, self.visit)
-        if node.return_type:
-            node.return_type = self.visit(node.return_type)
+        node.return_type = self._visit_optional(node.return_type)
         return node
 
     def visit_Expression(self, node: ast.Expression, context=None) -> ast.Expression:
@@ -146,7 +179,6 @@ class GenericTransformer(QASMTransformer):
             q1
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_UnaryExpression(
@@ -162,7 +194,6 @@ class GenericTransformer(QASMTransformer):
             -i
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_BinaryExpression(
@@ -176,7 +207,6 @@ class GenericTransformer(QASMTransformer):
             q1 || q2
 
         """
-        node = self.visit_Expression(node)
         node.lhs = self.visit(node.lhs)
         node.rhs = self.visit(node.rhs)
         return node
@@ -192,7 +222,6 @@ class GenericTransformer(QASMTransformer):
             1
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_FloatLiteral(
@@ -206,7 +235,6 @@ class GenericTransformer(QASMTransformer):
             1.1
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_ImaginaryLiteral(
@@ -220,7 +248,6 @@ class GenericTransformer(QASMTransformer):
             1.1im
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_BooleanLiteral(
@@ -235,7 +262,6 @@ class GenericTransformer(QASMTransformer):
             false
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_BitstringLiteral(
@@ -243,7 +269,6 @@ class GenericTransformer(QASMTransformer):
     ) -> ast.BitstringLiteral:
         """A literal bitstring value.  The ``value`` is the numerical value of the
         bitstring, and the ``width`` is the number of digits given."""
-        node = self.visit_Expression(node)
         return node
 
     def visit_DurationLiteral(
@@ -257,7 +282,6 @@ class GenericTransformer(QASMTransformer):
             1.0ns
 
         """
-        node = self.visit_Expression(node)
         return node
 
     def visit_ArrayLiteral(
@@ -271,7 +295,6 @@ class GenericTransformer(QASMTransformer):
             array[uint[8], 2, 2] my_array = {{1, 2}, {3, 4}};
             array[uint[8], 2, 2] my_array = {row, row};
         """
-        node = self.visit_Expression(node)
         node.values = self._visit_list(node.values, self.visit)
         return node
 
@@ -288,7 +311,6 @@ class GenericTransformer(QASMTransformer):
             foo // <- name
 
         """
-        node = self.visit_Expression(node)
         node.name = self.visit_Identifier(node.name)
         node.arguments = self._visit_list(node.arguments, self.visit)
         return node
@@ -302,7 +324,6 @@ class GenericTransformer(QASMTransformer):
             counts += int[1](b);
 
         """
-        node = self.visit_Expression(node)
         node.type = self.visit(node.type)
         node.argument = self.visit(node.argument)
         return node
@@ -330,18 +351,15 @@ class GenericTransformer(QASMTransformer):
             1:1:10
             :
         """
-        if node.start:
-            node.start = self.visit(node.start)
-        if node.end:
-            node.end = self.visit(node.end)
-        if node.step:
-            node.step = self.visit(node.step)
+        node.start = self._visit_optional(node.start)
+        node.end = self._visit_optional(node.end)
+        node.step = self._visit_optional(node.step)
         return node
 
     IndexElement = ast.DiscreteSet | list[ast.Expression | ast.RangeDefinition]
 
     def _visit_IndexElement(self, node: IndexElement, context=None) -> IndexElement:
-        if isinstance(node, list):
+        if type(node) is list:
             return self._visit_list(node, self.visit)
         return self.visit(node)
 
@@ -355,9 +373,13 @@ class GenericTransformer(QASMTransformer):
 
             q[1]
         """
-        node = self.visit_Expression(node)
         node.collection = self.visit(node.collection)
-        node.index = self._visit_IndexElement(node.index)
+        index = node.index
+        node.index = (
+            self._visit_list(index, self.visit)
+            if type(index) is list
+            else self.visit(index)
+        )
         return node
 
     def visit_IndexedIdentifier(
@@ -385,7 +407,6 @@ class GenericTransformer(QASMTransformer):
             a ++ b
             a[2:3] ++ a[0:1]
         """
-        node = self.visit_Expression(node)
         node.lhs = self.visit(node.lhs)
         node.rhs = self.visit(node.rhs)
         return node
@@ -413,8 +434,7 @@ class GenericTransformer(QASMTransformer):
         node.name = self.visit_Identifier(node.name)
         node.arguments = self._visit_list(node.arguments, self.visit)
         node.qubits = self._visit_list(node.qubits, self.visit)
-        if node.duration:
-            node.duration = self.visit(node.duration)
+        node.duration = self._visit_optional(node.duration)
         return node
 
     def visit_QuantumGateModifier(
@@ -433,8 +453,7 @@ class GenericTransformer(QASMTransformer):
             pow(1/2)
             ctrl
         """
-        if node.argument:
-            node.argument = self.visit(node.argument)
+        node.argument = self._visit_optional(node.argument)
         return node
 
     def visit_QuantumPhase(
@@ -485,8 +504,7 @@ class GenericTransformer(QASMTransformer):
         and returns)."""
         node = self.visit_Statement(node)
         node.measure = self.visit_QuantumMeasurement(node.measure)
-        if node.target:
-            node.target = self.visit(node.target)
+        node.target = self._visit_optional(node.target)
         return node
 
     def visit_QuantumBarrier(
@@ -550,8 +568,7 @@ class GenericTransformer(QASMTransformer):
         node = self.visit_Statement(node)
         node.type = self.visit(node.type)
         node.identifier = self.visit_Identifier(node.identifier)
-        if node.init_expression:
-            node.init_expression = self.visit(node.init_expression)
+        node.init_expression = self._visit_optional(node.init_expression)
         return node
 
     def visit_IODeclaration(
@@ -604,9 +621,7 @@ class GenericTransformer(QASMTransformer):
             int[8]
             int[16]
         """
-        node = self.visit_ClassicalType(node)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_UintType(self, node: ast.UintType, context=None) -> ast.UintType:
@@ -620,9 +635,7 @@ class GenericTransformer(QASMTransformer):
             uint[16]
         """
 
-        node = self.visit_ClassicalType(node)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_FloatType(self, node: ast.FloatType, context=None) -> ast.FloatType:
@@ -635,9 +648,7 @@ class GenericTransformer(QASMTransformer):
             float[16]
             float[64]
         """
-        node = self.visit_ClassicalType(node)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_ComplexType(self, node: ast.ComplexType, context=None) -> ast.ComplexType:
@@ -650,9 +661,7 @@ class GenericTransformer(QASMTransformer):
             complex[float]
             complex[float[32]]
         """
-        node = self.visit_ClassicalType(node)
-        if node.base_type:
-            node.base_type = self.visit(node.base_type)
+        node.base_type = self._visit_optional(node.base_type)
         return node
 
     def visit_AngleType(self, node: ast.AngleType, context=None) -> ast.AngleType:
@@ -664,9 +673,7 @@ class GenericTransformer(QASMTransformer):
             angle[8]
             angle[16]
         """
-        node = self.visit_ClassicalType(node)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_BitType(self, node: ast.BitType, context=None) -> ast.BitType:
@@ -678,16 +685,13 @@ class GenericTransformer(QASMTransformer):
             bit[8]
             creg[8]
         """
-        node = self.visit_ClassicalType(node)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_BoolType(self, node: ast.BoolType, context=None) -> ast.BoolType:
         """
         Leaf node representing the Boolean classical type.
         """
-        node = self.visit_ClassicalType(node)
         return node
 
     def visit_ArrayType(self, node: ast.ArrayType, context=None) -> ast.ArrayType:
@@ -696,7 +700,6 @@ class GenericTransformer(QASMTransformer):
         This is generally any array declared as a standard statement, but not
         arrays declared by being arguments to subroutines.
         """
-        node = self.visit_ClassicalType(node)
         node.base_type = self.visit(node.base_type)
         node.dimensions = self._visit_list(node.dimensions, self.visit)
         return node
@@ -720,7 +723,6 @@ class GenericTransformer(QASMTransformer):
             def f(const array[uint[8], #dim=3] b) {}
         """
 
-        node = self.visit_ClassicalType(node)
         node.base_type = self.visit(node.base_type)
         node.dimensions = (
             self._visit_list(node.dimensions, self.visit)
@@ -735,14 +737,12 @@ class GenericTransformer(QASMTransformer):
         """
         Leaf node representing the ``duration`` type.
         """
-        node = self.visit_ClassicalType(node)
         return node
 
     def visit_StretchType(self, node: ast.StretchType, context=None) -> ast.StretchType:
         """
         Leaf node representing the ``stretch`` type.
         """
-        node = self.visit_ClassicalType(node)
         return node
 
     def visit_CalibrationGrammarDeclaration(
@@ -795,8 +795,7 @@ class GenericTransformer(QASMTransformer):
         node.arguments = self._visit_list(node.arguments, self.visit)
         node.qubits = self._visit_list(node.qubits, self.visit_Identifier)
         node.body = self._visit_list(node.body, self.visit)
-        if node.return_type:
-            node.return_type = self.visit(node.return_type)
+        node.return_type = self._visit_optional(node.return_type)
         return node
 
     def visit_SubroutineDefinition(
@@ -817,8 +816,7 @@ class GenericTransformer(QASMTransformer):
         node.name = self.visit_Identifier(node.name)
         node.arguments = self._visit_list(node.arguments, self.visit)
         node.body = self._visit_list(node.body, self.visit)
-        if node.return_type:
-            node.return_type = self.visit(node.return_type)
+        node.return_type = self._visit_optional(node.return_type)
         return node
 
     def visit_QuantumArgument(
@@ -828,8 +826,7 @@ class GenericTransformer(QASMTransformer):
         Quantum argument for a subroutine declaration
         """
         node.name = self.visit_Identifier(node.name)
-        if node.size:
-            node.size = self.visit(node.size)
+        node.size = self._visit_optional(node.size)
         return node
 
     def visit_ReturnStatement(
@@ -846,8 +843,7 @@ class GenericTransformer(QASMTransformer):
 
         """
         node = self.visit_Statement(node)
-        if node.expression:
-            node.expression = self.visit(node.expression)
+        node.expression = self._visit_optional(node.expression)
         return node
 
     def visit_BreakStatement(
@@ -968,7 +964,7 @@ class GenericTransformer(QASMTransformer):
             }
         """
         node = self.visit_QuantumStatement(node)
-        node.duration = self.visit(node.duration) if node.duration else None
+        node.duration = self._visit_optional(node.duration)
         node.body = self._visit_list(node.body, self.visit)
         return node
 
@@ -980,16 +976,13 @@ class GenericTransformer(QASMTransformer):
 
             durationof({x $0;})
         """
-        node = self.visit_Expression(node)
         node.target = self._visit_list(node.target, self.visit)
         return node
 
     def visit_SizeOf(self, node: ast.SizeOf, context=None) -> ast.SizeOf:
         """``sizeof`` an array's dimensions."""
-        node = self.visit_Expression(node)
         node.target = self.visit(node.target)
-        if node.index:
-            node.index = self.visit(node.index)
+        node.index = self._visit_optional(node.index)
         return node
 
     def visit_AliasStatement(
@@ -1035,13 +1028,10 @@ class GenericTransformer(QASMTransformer):
     def visit_WaveformType(
         self, node: ast.WaveformType, context=None
     ) -> ast.WaveformType:
-        node = self.visit_ClassicalType(node)
         return node
 
     def visit_PortType(self, node: ast.PortType, context=None) -> ast.PortType:
-        node = self.visit_ClassicalType(node)
         return node
 
     def visit_FrameType(self, node: ast.FrameType, context=None) -> ast.FrameType:
-        node = self.visit_ClassicalType(node)
         return node
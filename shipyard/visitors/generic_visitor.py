@@ -1,14 +1,50 @@
+from collections import deque
+
 from openpulse import ast
 from openqasm3.visitor import QASMVisitor
 
 # pylint: disable=C0103,W0613,R0904
 
+# consumes an iterator without storing its items, used to drive map() at C speed
+_consume = deque(maxlen=0).extend
+
 
 class GenericVisitor(QASMVisitor):
+    # maps node classes to the (unbound) visitor method used for them, each
+    # subclass gets its own cache so overridden visitors are respected
+    _visitor_cache: dict[type, callable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitor_cache = {}
+
+    def visit(self, node: ast.QASMNode, context=None):
+        """
+        Visit a node, dispatching to the 'visit_{node class name}' method of the
+        visitor or to 'generic_visit' if no such method exists.
+
+        The visitor method is looked up once per node class and visitor class
+        and cached, instead of being resolved by name for every visited node.
+        """
+        node_class = type(node)
+        try:
+            visitor = self._visitor_cache[node_class]
+        except KeyError:
+            visitor = getattr(
+                type(self), f"visit_{node_class.__name__}", type(self).generic_visit
+            )
+            self._visitor_cache[node_class] = visitor
+        return visitor(self, node, context) if context else visitor(self, node)
+
     def _visit_list(
         self, nodes: list[ast.QASMNode], visit_function: callable, context=None
     ):
-        [visit_function(node) for node in nodes]
+        _consume(map(visit_function, nodes))
+
+    def _visit_optional(self, node: ast.QASMNode | None):
+        """Visit an optional child node, ``None`` is skipped"""
+        if node is not None:
+            self.visit(node)
 
     def visit_Program(self, node: ast.Program, context=None):
         """
@@ -53,8 +89,7 @@ class GenericVisitor(QASMVisitor):
         """
         self.visit_Statement(node)
         self.visit_Identifier(node.qubit)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_QuantumGateDefinition(
         self, node: ast.QuantumGateDefinition, context=None
@@ -70,9 +105,10 @@ class GenericVisitor(QASMVisitor):
 
         """
         self.visit_Statement(node)
-        self.visit_Identifier(node.name)
-        self._visit_list(node.arguments, self.visit_Identifier)
-        self._visit_list(node.qubits, self.visit_Identifier)
+        visit_id = self.visit_Identifier
+        visit_id(node.name)
+        self._visit_list(node.arguments, visit_id)
+        self._visit_list(node.qubits, visit_id)
         self._visit_list(node.body, self.visit)
 
     def visit_QuantumStatement(self, node: ast.QuantumStatement, context=None):
@@ -95,8 +131,7 @@ class GenericVisitor(QASMVisitor):
         self.visit_Statement(node)
         self.visit_Identifier(node.name)
         self._visit_list(node.arguments, self.visit)
-        if node.return_type:
-            self.visit(node.return_type)
+        self._visit_optional(node.return_type)
 
     def visit_Expression(self, node: ast.Expression, context=None):
         """An expression: anything that returns a value"""
@@ -259,12 +294,9 @@ class GenericVisitor(QASMVisitor):
             1:1:10
             :
         """
-        if node.start:
-            self.visit(node.start)
-        if node.end:
-            self.visit(node.end)
-        if node.step:
-            self.visit(node.step)
+        self._visit_optional(node.start)
+        self._visit_optional(node.end)
+        self._visit_optional(node.step)
 
     IndexElement = ast.DiscreteSet | list[ast.Expression | ast.RangeDefinition]
 
@@ -330,8 +362,7 @@ class GenericVisitor(QASMVisitor):
         self.visit_Identifier(node.name)
         self._visit_list(node.arguments, self.visit)
         self._visit_list(node.qubits, self.visit)
-        if node.duration:
-            self.visit(node.duration)
+        self._visit_optional(node.duration)
 
     def visit_QuantumGateModifier(self, node: ast.QuantumGateModifier, context=None):
         """
@@ -347,8 +378,7 @@ class GenericVisitor(QASMVisitor):
             pow(1/2)
             ctrl
         """
-        if node.argument:
-            self.visit(node.argument)
+        self._visit_optional(node.argument)
 
     def visit_QuantumPhase(self, node: ast.QuantumPhase, context=None):
         """
@@ -390,8 +420,7 @@ class GenericVisitor(QASMVisitor):
         and returns)."""
         self.visit_Statement(node)
         self.visit_QuantumMeasurement(node.measure)
-        if node.target:
-            self.visit(node.target)
+        self._visit_optional(node.target)
 
     def visit_QuantumBarrier(self, node: ast.QuantumBarrier, context=None):
         """
@@ -440,8 +469,7 @@ class GenericVisitor(QASMVisitor):
         self.visit_Statement(node)
         self.visit(node.type)
         self.visit_Identifier(node.identifier)
-        if node.init_expression:
-            self.visit(node.init_expression)
+        self._visit_optional(node.init_expression)
 
     def visit_IODeclaration(self, node: ast.IODeclaration, context=None):
         """
@@ -485,8 +513,7 @@ class GenericVisitor(QASMVisitor):
             int[16]
         """
         self.visit_ClassicalType(node)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_UintType(self, node: ast.UintType, context=None):
         """
@@ -500,8 +527,7 @@ class GenericVisitor(QASMVisitor):
         """
 
         self.visit_ClassicalType(node)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_FloatType(self, node: ast.FloatType, context=None):
         """
@@ -514,8 +540,7 @@ class GenericVisitor(QASMVisitor):
             float[64]
         """
         self.visit_ClassicalType(node)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_ComplexType(self, node: ast.ComplexType, context=None):
         """
@@ -528,8 +553,7 @@ class GenericVisitor(QASMVisitor):
             complex[float[32]]
         """
         self.visit_ClassicalType(node)
-        if node.base_type:
-            self.visit(node.base_type)
+        self._visit_optional(node.base_type)
 
     def visit_AngleType(self, node: ast.AngleType, context=None):
         """
@@ -541,8 +565,7 @@ class GenericVisitor(QASMVisitor):
             angle[16]
         """
         self.visit_ClassicalType(node)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_BitType(self, node: ast.BitType, context=None):
         """
@@ -554,8 +577,7 @@ class GenericVisitor(QASMVisitor):
             creg[8]
         """
         self.visit_ClassicalType(node)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_BoolType(self, node: ast.BoolType, context=None):
         """
@@ -648,12 +670,12 @@ class GenericVisitor(QASMVisitor):
             }
         """
         self.visit_Statement(node)
+        visit = self.visit
         self.visit_Identifier(node.name)
-        self._visit_list(node.arguments, self.visit)
+        self._visit_list(node.arguments, visit)
         self._visit_list(node.qubits, self.visit_Identifier)
-        self._visit_list(node.body, self.visit)
-        if node.return_type:
-            self.visit(node.return_type)
+        self._visit_list(node.body, visit)
+        self._visit_optional(node.return_type)
 
     def visit_SubroutineDefinition(self, node: ast.SubroutineDefinition, context=None):
         """
@@ -668,19 +690,18 @@ class GenericVisitor(QASMVisitor):
             }
         """
         self.visit_Statement(node)
+        visit = self.visit
         self.visit_Identifier(node.name)
-        self._visit_list(node.arguments, self.visit)
-        self._visit_list(node.body, self.visit)
-        if node.return_type:
-            self.visit(node.return_type)
+        self._visit_list(node.arguments, visit)
+        self._visit_list(node.body, visit)
+        self._visit_optional(node.return_type)
 
     def visit_QuantumArgument(self, node: ast.QuantumArgument, context=None):
         """
         Quantum argument for a subroutine declaration
         """
         self.visit_Identifier(node.name)
-        if node.size:
-            self.visit(node.size)
+        self._visit_optional(node.size)
 
     def visit_ReturnStatement(self, node: ast.ReturnStatement, context=None):
         """
@@ -694,8 +715,7 @@ class GenericVisitor(QASMVisitor):
 
         """
         self.visit_Statement(node)
-        if node.expression:
-            self.visit(node.expression)
+        self._visit_optional(node.expression)
 
     def visit_BreakStatement(self, node: ast.BreakStatement, context=None):
         """
@@ -798,8 +818,7 @@ class GenericVisitor(QASMVisitor):
             }
         """
         self.visit_QuantumStatement(node)
-        if node.duration:
-            self.visit(node.duration)
+        self._visit_optional(node.duration)
         self._visit_list(node.body, self.visit)
 
     def visit_DurationOf(self, node: ast.DurationOf, context=None):
@@ -817,8 +836,7 @@ class GenericVisitor(QASMVisitor):
         """``sizeof`` an array's dimensions."""
         self.visit_Expression(node)
         self.visit(node.target)
-        if node.index:
-            self.visit(node.index)
+        self._visit_optional(node.index)
 
     def visit_AliasStatement(self, node: ast.AliasStatement, context=None):
         """
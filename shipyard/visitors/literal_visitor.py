@@ -21,10 +21,7 @@ class LiteralVisitor:
         Returns:
             str: string representation of the node value
         """
-        value = bin(node.value)[2:]
-        if len(value) < node.width:
-            value = "0" * (node.width - len(value)) + value
-        return f'"{value}"'
+        return f'"{node.value:0{node.width}b}"'
 
     def visit_IntegerLiteral(self, node: ast.IntegerLiteral) -> str:
         """
@@ -63,7 +60,7 @@ class LiteralVisitor:
         Returns:
             str: string representation of the node value
         """
-        return str(node.value) + "im"
+        return f"{node.value}im"
 
     def visit_BooleanLiteral(self, node: ast.BooleanLiteral) -> str:
         """
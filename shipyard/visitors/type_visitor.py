@@ -4,10 +4,15 @@
 # todo take another pass at this with better documentation in mind
 
 
+import sys
+
 from openpulse import ast
 
 # pylint: disable=C0103
 
+# type node names only depend on the class of the node, cache them per class
+_TYPE_NAME_CACHE: dict[type, str] = {}
+
 
 class TypeVisitor:
     """Class defining methods for visiting openQASM type-nodes"""
@@ -25,7 +30,14 @@ class TypeVisitor:
         Returns:
             str: name of the node type
         """
-        return str(node.__class__.__name__).upper().split("TYPE", maxsplit=1)[0]
+        node_class = type(node)
+        try:
+            return _TYPE_NAME_CACHE[node_class]
+        except KeyError:
+            name = node_class.__name__.upper().split("TYPE", maxsplit=1)[0]
+            name = sys.intern(name)
+            _TYPE_NAME_CACHE[node_class] = name
+            return name
 
     def _visit_type_node_wrapper(self, node: ast.ClassicalType):
         return self._visit_type_node(node)
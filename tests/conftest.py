@@ -1,5 +1,40 @@
 """Common text fixtures and other test configurations for aq_data"""
 
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from shipyard.setup.internal import SetupInternal
+
 pytest_plugins = [
     "tests.node_fixtures",
 ]
+
+SETUPS_DIR = Path(__file__).parent / "setups"
+
+
+@pytest.fixture(name="load_setup", scope="session")
+def fixture_load_setup() -> Callable[[str], SetupInternal]:
+    """
+    Loads setups from the tests/setups directory, each file is only parsed once per
+    session.
+
+    The same SetupInternal instance is handed to every test that loads a file, tests
+    must treat it as read-only. Tests that modify a setup should load their own copy
+    with SetupInternal.from_json.
+    """
+    setups: dict[str, SetupInternal] = {}
+
+    def load_setup(file: str) -> SetupInternal:
+        if file not in setups:
+            setups[file] = SetupInternal.from_json(SETUPS_DIR / file)
+        return setups[file]
+
+    return load_setup
+
+
+@pytest.fixture(name="complex_setup", scope="session")
+def fixture_complex_setup(load_setup: Callable[[str], SetupInternal]) -> SetupInternal:
+    """Read-only SetupInternal loaded from setups/complex.json"""
+    return load_setup("complex.json")
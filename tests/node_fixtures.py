@@ -8,7 +8,7 @@ from openpulse import ast
 #     return ast.Program([])
 
 
-@pytest.fixture(name="extern_declaration")
+@pytest.fixture(name="extern_declaration", scope="session")
 def fixture_extern_declaration() -> ast.ExternDeclaration:
     return ast.ExternDeclaration(
         name=ast.Identifier("test_extern"),
@@ -17,7 +17,7 @@ def fixture_extern_declaration() -> ast.ExternDeclaration:
     )
 
 
-@pytest.fixture(name="subroutine_definition")
+@pytest.fixture(name="subroutine_definition", scope="session")
 def fixture_subroutine_definition() -> ast.SubroutineDefinition:
     return ast.SubroutineDefinition(
         name=ast.Identifier("test_subroutine"),
@@ -32,7 +32,7 @@ def fixture_subroutine_definition() -> ast.SubroutineDefinition:
     )
 
 
-@pytest.fixture(name="quantum_gate_definition")
+@pytest.fixture(name="quantum_gate_definition", scope="session")
 def fixture_quantum_gate_definition() -> ast.QuantumGateDefinition:
     return ast.QuantumGateDefinition(
         name=ast.Identifier("test_gate"),
@@ -42,7 +42,7 @@ def fixture_quantum_gate_definition() -> ast.QuantumGateDefinition:
     )
 
 
-@pytest.fixture(name="cal_statement")
+@pytest.fixture(name="cal_statement", scope="session")
 def fixture_cal_statement() -> ast.CalibrationStatement:
     return ast.CalibrationStatement(
         [
@@ -60,7 +60,7 @@ def fixture_cal_statement() -> ast.CalibrationStatement:
     )
 
 
-@pytest.fixture(name="defcal_definition")
+@pytest.fixture(name="defcal_definition", scope="session")
 def fixture_defcal_definition() -> ast.CalibrationDefinition:
     return ast.CalibrationDefinition(
         name=ast.Identifier("test_defcal"),
@@ -75,7 +75,7 @@ def fixture_defcal_definition() -> ast.CalibrationDefinition:
     )
 
 
-@pytest.fixture(name="quantum_gate")
+@pytest.fixture(name="quantum_gate", scope="session")
 def fixture_quantum_gate() -> ast.QuantumGate:
     return ast.QuantumGate(
         modifiers=[],
@@ -85,7 +85,7 @@ def fixture_quantum_gate() -> ast.QuantumGate:
     )
 
 
-@pytest.fixture(name="range_definition")
+@pytest.fixture(name="range_definition", scope="session")
 def fixture_range_definition() -> ast.RangeDefinition:
     return ast.RangeDefinition(
         start=ast.IntegerLiteral(0),
@@ -94,12 +94,12 @@ def fixture_range_definition() -> ast.RangeDefinition:
     )
 
 
-@pytest.fixture(name="discrete_set")
+@pytest.fixture(name="discrete_set", scope="session")
 def fixture_discrete_set() -> ast.DiscreteSet:
     return ast.DiscreteSet([ast.FloatLiteral(3.2), ast.FloatLiteral(1.2)])
 
 
-@pytest.fixture(name="branching_statement")
+@pytest.fixture(name="branching_statement", scope="session")
 def fixture_branching_statement() -> ast.BranchingStatement:
     return ast.BranchingStatement(
         condition=ast.BooleanLiteral(True),
@@ -108,14 +108,14 @@ def fixture_branching_statement() -> ast.BranchingStatement:
     )
 
 
-@pytest.fixture(name="while_loop")
+@pytest.fixture(name="while_loop", scope="session")
 def fixture_while_loop() -> ast.WhileLoop:
     return ast.WhileLoop(
         while_condition=ast.BooleanLiteral(True), block=[ast.Statement()]
     )
 
 
-@pytest.fixture(name="box")
+@pytest.fixture(name="box", scope="session")
 def fixture_box() -> ast.Box:
     return ast.Box(
         duration=ast.DurationLiteral(1.0, ast.TimeUnit.ns), body=[ast.Statement()]
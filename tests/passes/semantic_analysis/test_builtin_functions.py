@@ -4,6 +4,8 @@ just ensures that the generated list are lists of ExternSymbols.
 More Rigourous testing on each function should be implemented
 if we start using this module dynamically
 """
+import pytest
+
 from shipyard.passes.semantic_analysis.builtin_functions import (
     BUILTIN_OPENPULSE,
     BUILTIN_ZI_EXP,
@@ -12,22 +14,16 @@ from shipyard.passes.semantic_analysis.builtin_functions import (
 )
 
 
-def test_builtin_functions():
+@pytest.mark.parametrize(
+    "symbol_list", [BUILTIN_OPENPULSE, BUILTIN_ZI_EXP, BUILTIN_ZI_WFM]
+)
+def test_builtin_functions(symbol_list: list[ExternSymbol]):
     """
     Test that the symbol lists created by the
     builtin_functions modules are lists
     of ExternSymbols
     """
-
-    def _test_symbol_list(symbol_list: list[ExternSymbol]):
-        for symbol in symbol_list:
-            assert isinstance(symbol, ExternSymbol)
-
-    symbol_lists = [
-        BUILTIN_OPENPULSE,
-        BUILTIN_ZI_EXP,
-        BUILTIN_ZI_WFM,
-    ]
-
-    for symbol_list in symbol_lists:
-        _test_symbol_list(symbol_list)
+    # a single assertion that reports every offending symbol on failure
+    assert [
+        symbol for symbol in symbol_list if not isinstance(symbol, ExternSymbol)
+    ] == []
@@ -71,19 +71,22 @@ def fixture_defcal_table(
     return sst.CalScopedSymbolTable("defcal", enclosing_scope=cal_table)
 
 
-def test_scoped_symbol_table_basic(main_table: sst.ScopedSymbolTable):
-    """Test basic insertion and lookup in table without enclosing scope"""
+@pytest.mark.parametrize("symbol_list", SYMBOL_LISTS)
+def test_scoped_symbol_table_built_in(
+    main_table: sst.ScopedSymbolTable, symbol_list: list[symbols.Symbol]
+):
+    """Test lookup of built in symbols in table without enclosing scope"""
     # test that built in symbols have been inserted
-    for symbol_list in SYMBOL_LISTS:
-        symbol_names = []
-        for symbol in symbol_list:
-            assert main_table.lookup(symbol.name) is symbol
-            symbol_names.append(symbol.name)
-        # test that names of builtin symbols are returned by the keys method
-        for name in symbol_names:
-            assert name in main_table.keys()
-            assert name in main_table.keys(current_scope_only=True)
+    for symbol in symbol_list:
+        assert main_table.lookup(symbol.name) is symbol
+    # test that names of builtin symbols are returned by the keys method
+    symbol_names = {symbol.name for symbol in symbol_list}
+    assert symbol_names <= main_table.keys()
+    assert symbol_names <= main_table.keys(current_scope_only=True)
 
+
+def test_scoped_symbol_table_basic(main_table: sst.ScopedSymbolTable):
+    """Test basic insertion and lookup in table without enclosing scope"""
     # test inserting a symbol and lookin it up and name being returned by keys()
     c_symbol = symbols.ClassicalSymbol(name="test", kind=symbols.angle_type.name)
     main_table.insert(c_symbol)
@@ -102,16 +105,14 @@ def test_scoped_symbol_table_nested_built_in(
     """Test basic insertion and lookup in table with ensclosing scope"""
     # test that built in symbols are found when looking in all scopes
     # but not when only looking in current scope
-    symbol_names = []
     for symbol in symbol_list:
         assert nested_table.lookup(symbol.name) is symbol
         assert nested_table.lookup(symbol.name, current_scope_only=True) is None
-        symbol_names.append(symbol.name)
-    for name in symbol_names:
-        # test that names of built in symbols are returned by the keys method
-        assert name in nested_table.keys()
-        # but not when looking through only the nested scope
-        assert name not in nested_table.keys(current_scope_only=True)
+    symbol_names = {symbol.name for symbol in symbol_list}
+    # test that names of built in symbols are returned by the keys method
+    assert symbol_names <= nested_table.keys()
+    # but not when looking through only the nested scope
+    assert symbol_names.isdisjoint(nested_table.keys(current_scope_only=True))
 
 
 def test_scoped_symbol_table_nested(nested_table: sst.ScopedSymbolTable):
@@ -176,3 +177,27 @@ def test_defcal_table(
     for symbol in symbol_list:
         assert defcal_table.lookup(symbol.name) is symbol
         assert defcal_table.lookup(symbol.name, current_scope_only=True) is None
+
+
+def test_builtins_not_shared_between_tables(main_table: sst.ScopedSymbolTable):
+    """Test that symbols inserted into one table do not end up in other tables
+    initialised with the same (cached) builtin symbols"""
+    c_symbol = symbols.ClassicalSymbol(name="test", kind=symbols.angle_type.name)
+    main_table.insert(c_symbol)
+    assert sst.ScopedSymbolTable("other").lookup("test") is None
+
+    cal_table = sst.CalScopedSymbolTable("cal", init_cal=True)
+    cal_table.insert(c_symbol)
+    assert sst.CalScopedSymbolTable("other", init_cal=True).lookup("test") is None
+
+
+def test_keys_nested_unique(nested_table: sst.ScopedSymbolTable):
+    """Test that keys() lists names in the current scope first and names shadowing
+    symbols in the enclosing scope only once"""
+    c_symbol = symbols.ClassicalSymbol(name="test", kind=symbols.angle_type.name)
+    nested_table.enclosing_scope.insert(c_symbol)
+    nested_table.insert(c_symbol)
+    names = list(nested_table.keys())
+    assert names[0] == "test"
+    assert names.count("test") == 1
+    assert len(names) == len(nested_table.enclosing_scope.keys())
@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -17,6 +19,16 @@ from shipyard.passes.semantic_analysis.semantic_analyzer import (
     SemanticAnalyzer,
 )
 
+QASM_DIR = Path(__file__).parent.parent.parent / "qasm"
+
+
+@lru_cache(maxsize=None)
+def parse_file(file: str) -> ast.Program:
+    """Parse a file in the qasm test folder, each file is only parsed once.
+    The returned program is shared between tests, it must be deep copied before
+    any pass visits it."""
+    return parse((QASM_DIR / file).read_text(encoding="utf_8"))
+
 
 def test_end_to_end():
     """
@@ -25,20 +37,14 @@ def test_end_to_end():
         parses the code to an Abstract Syntax Tree (AST)
         performs semantic analysis on the porgram
     """
-    path = Path(__file__).parent.parent.parent / "qasm/complex.qasm"
-    with open(path, encoding="utf_8") as qasm_file:
-        qasm_code = qasm_file.read()
-    qasm_ast = parse(qasm_code)
+    qasm_ast = deepcopy(parse_file("complex.qasm"))
 
     semantic_analyzer = SemanticAnalyzer()
     semantic_analyzer.visit(qasm_ast)
 
 
 def qasm_files() -> list[str]:
-    base_path = Path(__file__).parent.parent.parent / "qasm"
-    plen = len(base_path.parts)
-    QASM_FILES = list(base_path.glob("**/*.qasm"))
-    return [str(Path(*path.parts[plen:])) for path in QASM_FILES]
+    return [str(path.relative_to(QASM_DIR)) for path in QASM_DIR.rglob("*.qasm")]
 
 
 QASM_FILES = qasm_files()
@@ -46,10 +52,7 @@ QASM_FILES = qasm_files()
 
 @pytest.mark.parametrize("file", QASM_FILES)
 def test_files_parse(file):
-    path = Path(__file__).parent.parent.parent / f"qasm/{file}"
-    with open(path, encoding="utf_8") as qasm_file:
-        qasm_code = qasm_file.read()
-    parse(qasm_code)
+    parse_file(file)
 
 
 SKIP_FILES_SA = [
@@ -60,15 +63,20 @@ SKIP_FILES_SA = [
 ]
 
 
-@pytest.mark.parametrize("file", QASM_FILES)
+@pytest.mark.parametrize(
+    "file",
+    [
+        pytest.param(file, marks=pytest.mark.xfail(run=False))
+        if file in SKIP_FILES_SA
+        else file
+        for file in QASM_FILES
+    ],
+)
 def test_files_sa(file):
-    if file in SKIP_FILES_SA:
-        pytest.xfail()
-    path = Path(__file__).parent.parent.parent / f"qasm/{file}"
-    with open(path, encoding="utf_8") as qasm_file:
-        qasm_code = qasm_file.read()
-    qasm_ast = parse(qasm_code)
-    IncludeAnalyzer(path).visit(qasm_ast)
+    qasm_ast = deepcopy(parse_file(file))
+    # include statements can only appear in the global scope
+    if any(isinstance(statement, ast.Include) for statement in qasm_ast.statements):
+        IncludeAnalyzer(QASM_DIR / file).visit(qasm_ast)
     semantic_analyzer = SemanticAnalyzer()
     semantic_analyzer.visit(qasm_ast)
 
@@ -348,11 +356,17 @@ def test_sa_visit_unary_expression(semantic_analyzer: SemanticAnalyzer):
 binary_operators = "> < >= <= == != && || | ^ & << >> + - * / % **".split(" ")
 
 
-@pytest.mark.parametrize("operator", binary_operators)
-def test_sa_visit_binary_expression(semantic_analyzer: SemanticAnalyzer, operator):
+@pytest.mark.parametrize(
+    "operator",
+    [ast.BinaryOperator[operator] for operator in binary_operators],
+    ids=binary_operators,
+)
+def test_sa_visit_binary_expression(
+    semantic_analyzer: SemanticAnalyzer, operator: ast.BinaryOperator
+):
     semantic_analyzer.visit(
         ast.BinaryExpression(
-            op=ast.BinaryOperator[operator],
+            op=operator,
             lhs=ast.BooleanLiteral(False),
             rhs=ast.BooleanLiteral(True),
         )
@@ -434,52 +448,51 @@ def test_sa_visit_concatenation(semantic_analyzer: SemanticAnalyzer):
     semantic_analyzer.visit(ast.Program([concatenation]))
 
 
-def test_sa_visit_bitstring_literal():
+def test_sa_visit_bitstring_literal(semantic_analyzer: SemanticAnalyzer):
     bs_node = ast.BitstringLiteral(7, 4)
-    assert SemanticAnalyzer().visit_BitstringLiteral(bs_node).name == '"0111"'
+    assert semantic_analyzer.visit_BitstringLiteral(bs_node).name == '"0111"'
 
 
-def test_sa_visit_int_literal():
-    for _ in range(100):
-        rand_int = randint(-10000, 10000)
+def test_sa_visit_int_literal(semantic_analyzer: SemanticAnalyzer):
+    for rand_int in randint(-10000, 10000, size=100).tolist():
         int_node = ast.IntegerLiteral(rand_int)
-        int_symbol = SemanticAnalyzer().visit_IntegerLiteral(int_node)
+        int_symbol = semantic_analyzer.visit_IntegerLiteral(int_node)
         assert int_symbol.name == f"{rand_int}"
         assert int_symbol.kind == "INT"
 
 
-def test_sa_visit_float_literal_literal():
-    for _ in range(100):
-        r_number = rand()
+def test_sa_visit_float_literal_literal(semantic_analyzer: SemanticAnalyzer):
+    for r_number in rand(100).tolist():
         f_node = ast.FloatLiteral(r_number)
-        f_symbol = SemanticAnalyzer().visit_FloatLiteral(f_node)
+        f_symbol = semantic_analyzer.visit_FloatLiteral(f_node)
         assert f_symbol.name == f"{r_number}"
         assert f_symbol.kind == "FLOAT"
 
 
-def test_sa_visit_imaginary_literal():
-    for _ in range(100):
-        r_number = rand()
+def test_sa_visit_imaginary_literal(semantic_analyzer: SemanticAnalyzer):
+    for r_number in rand(100).tolist():
         f_node = ast.ImaginaryLiteral(r_number)
-        f_symbol = SemanticAnalyzer().visit_ImaginaryLiteral(f_node)
+        f_symbol = semantic_analyzer.visit_ImaginaryLiteral(f_node)
         assert f_symbol.name == f"{r_number}im"
         assert f_symbol.kind == "IMAGINARY"
 
 
-def test_sa_visit_boolean_literal():
-    true_symbol = SemanticAnalyzer().visit_BooleanLiteral(ast.BooleanLiteral(True))
+def test_sa_visit_boolean_literal(semantic_analyzer: SemanticAnalyzer):
+    true_symbol = semantic_analyzer.visit_BooleanLiteral(ast.BooleanLiteral(True))
     assert true_symbol.name == "true"
     assert true_symbol.kind == "BOOL"
-    false_symbol = SemanticAnalyzer().visit_BooleanLiteral(ast.BooleanLiteral(False))
+    false_symbol = semantic_analyzer.visit_BooleanLiteral(ast.BooleanLiteral(False))
     assert false_symbol.name == "false"
     assert false_symbol.kind == "BOOL"
 
 
 @pytest.mark.parametrize("time_unit", ["ns", "us", "ms", "s", "dt"])
-def test_sa_visit_duration_literal(time_unit: str):
+def test_sa_visit_duration_literal(
+    semantic_analyzer: SemanticAnalyzer, time_unit: str
+):
     r_number = rand()
     d_node = ast.DurationLiteral(r_number, ast.TimeUnit[time_unit])
-    d_symbol = SemanticAnalyzer().visit_DurationLiteral(d_node)
+    d_symbol = semantic_analyzer.visit_DurationLiteral(d_node)
     assert d_symbol.name == f"{r_number}{time_unit}"
     assert d_symbol.kind == "DURATION"
 
@@ -9,9 +9,10 @@ from shipyard.passes.semantic_analysis import symbols
 @pytest.fixture(name="params")
 def fixture_params() -> list[symbols.Symbol]:
     """Test fixture that is a short list of Symbols"""
+    # known good arguments, no need to validate them when creating the symbols
     return [
-        symbols.ClassicalSymbol(name="arg1", kind=symbols.angle_type.name),
-        symbols.QuantumSymbol(name="arg2", kind=symbols.qubit_type.name),
+        symbols.ClassicalSymbol.construct(name="arg1", kind=symbols.angle_type.name),
+        symbols.QuantumSymbol.construct(name="arg2", kind=symbols.qubit_type.name),
     ]
 
 
@@ -26,42 +27,24 @@ def test_symbols():
     assert sym2.kind == "NOT_NONE"
 
 
-builtin_symbol_names = [
-    "ANGLE",
-    "ARRAY",
-    "BIT",
-    "BITSTRING",
-    "BOOL",
-    "COMPLEX",
-    "DURATION",
-    "FLOAT",
-    "IMAGINARY",
-    "INT",
-    "STRETCH",
-    "UINT",
-    "QUBIT",
-]
 builtin_symbols = [
-    symbols.angle_type,
-    symbols.array_type,
-    symbols.bit_type,
-    symbols.bitstring_type,
-    symbols.bool_type,
-    symbols.complex_type,
-    symbols.duration_type,
-    symbols.float_type,
-    symbols.imaginary_type,
-    symbols.int_type,
-    symbols.stretch_type,
-    symbols.uint_type,
-    symbols.qubit_type,
+    (symbols.angle_type, "ANGLE"),
+    (symbols.array_type, "ARRAY"),
+    (symbols.bit_type, "BIT"),
+    (symbols.bitstring_type, "BITSTRING"),
+    (symbols.bool_type, "BOOL"),
+    (symbols.complex_type, "COMPLEX"),
+    (symbols.duration_type, "DURATION"),
+    (symbols.float_type, "FLOAT"),
+    (symbols.imaginary_type, "IMAGINARY"),
+    (symbols.int_type, "INT"),
+    (symbols.stretch_type, "STRETCH"),
+    (symbols.uint_type, "UINT"),
+    (symbols.qubit_type, "QUBIT"),
 ]
 
 
-@pytest.mark.parametrize(
-    "symbol, name",
-    [(symbol, name) for (symbol, name) in zip(builtin_symbols, builtin_symbol_names)],
-)
+@pytest.mark.parametrize("symbol, name", builtin_symbols)
 def test_builtin_symbols(symbol: symbols.Symbol, name: str):
     """Test built in symbols have expected names and kinds"""
     assert symbol.name == name
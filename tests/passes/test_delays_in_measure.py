@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -8,6 +10,8 @@ from shipyard.passes.delays_in_measure import DelaysInMeasure, DetermineMaxDelay
 from shipyard.passes.duration_transformer import DurationTransformer
 from shipyard.setup.internal import SetupInternal
 
+QASM_DIR = Path(__file__).parent.parent / "qasm/delays_in_measure"
+
 FILES = ["one_delay", "two_delays", "two_variable_delays"]
 
 list_delays = [
@@ -23,25 +27,24 @@ list_max_delay = [
 ]
 
 
-def load_ast(file: str) -> ast.Program:
-    path = Path(__file__).parent.parent / f"qasm/delays_in_measure/{file}.qasm"
-    with open(path, encoding="utf_8") as qasm_file:
-        qasm_code = qasm_file.read()
-    return parse(qasm_code)
+@lru_cache(maxsize=None)
+def _parse_cached(path: str) -> ast.Program:
+    return parse(Path(path).read_text(encoding="utf_8"))
 
 
-def load_setup() -> SetupInternal:
-    json_path = Path(__file__).parent.parent / "setups/complex.json"
-    return SetupInternal.from_json(json_path)
+def load_ast(file: str) -> ast.Program:
+    path = QASM_DIR / f"{file}.qasm"
+    # DurationTransformer mutates the tree, hand out a fresh copy per call
+    return deepcopy(_parse_cached(str(path.resolve())))
 
 
 @pytest.mark.parametrize(
     "file, delays, max_delay", zip(FILES, list_delays, list_max_delay)
 )
-def test_determine_max_delay(file, delays, max_delay):
+def test_determine_max_delay(file, delays, max_delay, complex_setup: SetupInternal):
     prog = load_ast(file)
     DurationTransformer().visit(prog)
-    deter_max_delay = DetermineMaxDelay(setup=load_setup())
+    deter_max_delay = DetermineMaxDelay(setup=complex_setup)
     deter_max_delay.visit(prog)
 
     assert deter_max_delay.delays == delays
@@ -49,14 +52,11 @@ def test_determine_max_delay(file, delays, max_delay):
 
 
 @pytest.mark.parametrize("file", FILES)
-def test_delays_in_measure(file: str):
+def test_delays_in_measure(file: str, complex_setup: SetupInternal):
     loaded_ast = load_ast(file)
     DurationTransformer().visit(loaded_ast)
-    DelaysInMeasure(loaded_ast, setup=load_setup())
+    DelaysInMeasure(loaded_ast, setup=complex_setup)
     expected_ast = load_ast(f"processed/{file}")
     DurationTransformer().visit(expected_ast)
 
-    for generated, target in zip(
-        dumps(loaded_ast).split("\n"), dumps(expected_ast).split("\n")
-    ):
-        assert generated == target
+    assert dumps(loaded_ast) == dumps(expected_ast)
@@ -11,30 +11,32 @@ duration_nodes_and_samples = [
     (ast.DurationLiteral(1, ast.TimeUnit.s), 2_000_000_000),
 ]
 
+# DurationTransformer holds no state besides its sample rate, so one instance per
+# sample rate is shared between all parametrizations
+DURATION_TRANSFORMER = DurationTransformer()
+DURATION_TRANSFORMER_2_4GHZ = DurationTransformer(sample_rate=2.4e9)
+
 
 @pytest.mark.parametrize("node, expected", duration_nodes_and_samples)
 def test_duration_transformer_literal(node: ast.DurationLiteral, expected: int):
-    duration_transformer = DurationTransformer()
-    new_node = duration_transformer.visit(node)
+    new_node = DURATION_TRANSFORMER.visit(node)
     assert new_node.unit == ast.TimeUnit.dt
     assert new_node.value == expected
 
 
 @pytest.mark.parametrize("node, expected", duration_nodes_and_samples)
 def test_duration_transformer_const(node, expected):
-    duration_transformer = DurationTransformer()
     const_node = ast.ConstantDeclaration(
         ast.DurationType, ast.Identifier("some_time"), init_expression=node
     )
-    new_const_node = duration_transformer.visit(const_node)
+    new_const_node = DURATION_TRANSFORMER.visit(const_node)
     assert new_const_node.init_expression.unit == ast.TimeUnit.dt
     assert new_const_node.init_expression.value == expected
 
 
 @pytest.mark.parametrize("node, expected", duration_nodes_and_samples)
 def test_duration_transformer_different_sample_rate(node, expected):
-    duration_transformer = DurationTransformer(sample_rate=2.4e9)
-    new_node = duration_transformer.visit(node)
+    new_node = DURATION_TRANSFORMER_2_4GHZ.visit(node)
     assert new_node.unit == ast.TimeUnit.dt
     if node.unit.name != "dt":
         print(expected * 1.2)
@@ -1,4 +1,3 @@
-import io
 import json
 from pathlib import Path
 
@@ -8,75 +7,48 @@ from zhinst.toolkit import CommandTable
 
 from shipyard.compiler import Compiler
 from shipyard.compiler_error import SemanticError
-from shipyard.printers.zi.seqcprinter import SEQCPrinter
-from shipyard.setup.internal import SetupInternal
 
+QASM_DIR = Path(__file__).parent.parent / "qasm/command_table"
+SETUP_PATH = Path(__file__).parent.parent / "setups/complex.json"
 
-@pytest.fixture(name="basic_setup")
-def fixture_basic_setup() -> SetupInternal:
-    json_path = Path(__file__).parent.parent / "setups/complex.json"
-    return SetupInternal.from_json(json_path)
 
-
-@pytest.fixture(name="seqc_printer")
-def fixture_seqc_printer(basic_setup: SetupInternal) -> SEQCPrinter:
-    return SEQCPrinter(io.StringIO(), basic_setup)
+@pytest.fixture(name="hdawg_schema", scope="session")
+def fixture_hdawg_schema() -> dict:
+    with open(QASM_DIR / "hdawg_schema.json", encoding="utf_8") as schema_file:
+        return json.load(schema_file)
 
 
 def load_ast(file: str) -> ast.Program:
-    path = Path(__file__).parent.parent / f"qasm/command_table/{file}.qasm"
-    with open(path, encoding="utf_8") as qasm_file:
-        qasm_code = qasm_file.read()
-    return parse(qasm_code)
+    path = QASM_DIR / f"{file}.qasm"
+    return parse(path.read_text(encoding="utf_8"))
 
 
-def test_insert_commandtable(seqc_printer: SEQCPrinter, file="basic_ct"):
+def test_insert_commandtable(hdawg_schema: dict, file="basic_ct"):
     """
     Test for  just one command table and 1 HD core
     """
-    qasm_path = Path(__file__).parent.parent / f"qasm/command_table/{file}.qasm"
-    setup_path = Path(__file__).parent.parent / "setups/complex.json"
-    seqc_path = Path(__file__).parent.parent / "qasm/command_table/basic_ct.seqc"
-    hdawg_schema_path = (
-        Path(__file__).parent.parent / "qasm/command_table/hdawg_schema.json"
-    )
-
-    hdawg_schema = {}
-    with open(hdawg_schema_path, encoding="utf_8") as f:
-        hdawg_schema = json.load(f)
-    hdawg_schema = dict(hdawg_schema)
+    qasm_path = QASM_DIR / f"{file}.qasm"
+    seqc_path = QASM_DIR / "basic_ct.seqc"
     ct = CommandTable(hdawg_schema)
     ct.table[0].waveform.index = 0
     ct.table[0].waveform.length = 64
     ct_dict = {("hdawg1", 2, "HD"): ct}
-    compiler = Compiler(qasm_path, setup_path)
+    compiler = Compiler(qasm_path, SETUP_PATH)
 
     compiler.compile(command_tables=ct_dict)
 
-    with open(seqc_path, encoding="utf_8") as seqc_file:
-        seqc_code = seqc_file.read()
+    seqc_code = seqc_path.read_text(encoding="utf_8")
 
-    for generated, target in zip(
-        compiler.split_compiled[("hdawg1", 2, "HD")].split("\n"), seqc_code.split("\n")
-    ):
-        assert generated == target
+    generated = compiler.split_compiled[("hdawg1", 2, "HD")]
+    assert generated.rstrip("\n") == seqc_code.rstrip("\n")
 
 
-def test_insert_commandtable_2(seqc_printer: SEQCPrinter, file="two_cores"):
+def test_insert_commandtable_2(hdawg_schema: dict, file="two_cores"):
     """
     Test for just one command table and 1 HD core
     """
-    qasm_path = Path(__file__).parent.parent / f"qasm/command_table/{file}.qasm"
-    setup_path = Path(__file__).parent.parent / "setups/complex.json"
-    seqc_path = Path(__file__).parent.parent / "qasm/command_table/two_cores.seqc"
-    hdawg_schema_path = (
-        Path(__file__).parent.parent / "qasm/command_table/hdawg_schema.json"
-    )
-
-    hdawg_schema = {}
-    with open(hdawg_schema_path, encoding="utf_8") as f:
-        hdawg_schema = json.load(f)
-    hdawg_schema = dict(hdawg_schema)
+    qasm_path = QASM_DIR / f"{file}.qasm"
+    seqc_path = QASM_DIR / "two_cores.seqc"
     ct_1 = CommandTable(hdawg_schema)
     ct_1.table[0].waveform.index = 0
     ct_1.table[0].waveform.length = 64
@@ -89,14 +61,11 @@ def test_insert_commandtable_2(seqc_printer: SEQCPrinter, file="two_cores"):
         ("hdawg1", 1, "HD"): ct_1,
         ("hdawg1", 2, "HD"): ct_2,
     }  # changed from 2,2 to 1,2
-    compiler = Compiler(qasm_path, setup_path)
+    compiler = Compiler(qasm_path, SETUP_PATH)
 
     compiler.compile(command_tables=ct_dict)
 
-    with open(seqc_path, encoding="utf_8") as seqc_file:
-        seqc_code = seqc_file.read()
+    seqc_code = seqc_path.read_text(encoding="utf_8")
 
-    for generated, target in zip(
-        compiler.split_compiled[("hdawg1", 2, "HD")].split("\n"), seqc_code.split("\n")
-    ):
-        assert generated == target
+    generated = compiler.split_compiled[("hdawg1", 2, "HD")]
+    assert generated.rstrip("\n") == seqc_code.rstrip("\n")
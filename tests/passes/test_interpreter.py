@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
@@ -16,18 +17,42 @@ from shipyard.passes.resolve_io_declaration import ResolveIODeclaration
 from shipyard.passes.semantic_analysis.semantic_analyzer import SemanticAnalyzer
 from shipyard.printers.zi import waveform_functions
 from shipyard.setup.internal import Frame, Instrument, Port, SetupInternal
+from shipyard.visitors import CopyTransformer
 
+QASM_DIR = Path(__file__).parent.parent / "qasm/interpreter"
 
-def test_QubitDeclaration():
+
+@pytest.fixture(name="activation_record")
+def fixture_activation_record() -> ActivationRecord:
+    return ActivationRecord(name="main", ar_type=ARType.PROGRAM, nesting_level=1)
+
+
+@pytest.fixture(name="interp")
+def fixture_interp(activation_record: ActivationRecord) -> Interpreter:
     interp = Interpreter()
+    interp.call_stack.push(activation_record)
+    return interp
+
+
+def load_program(file: str) -> ast.Program:
+    # Compiler.load_program is cached, copy so the passes run by the tests do not
+    # alter the cached program
+    return CopyTransformer().visit_Program(Compiler.load_program(QASM_DIR / file))
+
+
+def prepare_program(file: str) -> ast.Program:
+    qasm_ast = load_program(file)
+    ResolveIODeclaration().visit(qasm_ast)
+    SemanticAnalyzer().visit(qasm_ast)
+    DurationTransformer().visit(qasm_ast)
+    return qasm_ast
+
+
+def test_QubitDeclaration(interp: Interpreter):
     qd_node = ast.QubitDeclaration(
         qubit=ast.Identifier("dummy"),
         size=ast.IntegerLiteral(value=2),
     )
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
-    interp.call_stack.push(activation_record)
     interp.visit_QubitDeclaration(qd_node)
     assert interp.call_stack.peek()["dummy"] == ["$0", "$1"]
 
@@ -45,13 +70,8 @@ def test_visit_SubroutineDefinition():
     assert interp.subroutines["dummy"] == sr_node
 
 
-def test_visit_Identifier():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_Identifier(interp: Interpreter, activation_record: ActivationRecord):
     activation_record.members["a"] = 1
-    interp.call_stack.push(activation_record)
     i_node = ast.Identifier("a")
     assert interp.visit_Identifier(i_node) == 1
 
@@ -86,14 +106,14 @@ def test_visit_Identifier():
     ],
 )
 def test_visit_BinaryExpression_numerical(
-    operator: ast.BinaryOperator, expected, lvalue, rvalue
+    operator: ast.BinaryOperator,
+    expected,
+    lvalue,
+    rvalue,
+    interp: Interpreter,
+    activation_record: ActivationRecord,
 ):
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
     activation_record.members["a"] = rvalue
-    interp.call_stack.push(activation_record)
     i_node = ast.Identifier("a")
     int_node = ast.IntegerLiteral(value=lvalue)
     be_node_plus = ast.BinaryExpression(op=operator, lhs=int_node, rhs=i_node)
@@ -110,14 +130,14 @@ def test_visit_BinaryExpression_numerical(
     ],
 )
 def test_visit_BinaryExpression_booleans(
-    operator: ast.BinaryOperator, expected, lvalue, rvalue
+    operator: ast.BinaryOperator,
+    expected,
+    lvalue,
+    rvalue,
+    interp: Interpreter,
+    activation_record: ActivationRecord,
 ):
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
     activation_record.members["a"] = rvalue
-    interp.call_stack.push(activation_record)
     i_node = ast.Identifier("a")
     int_node = ast.BooleanLiteral(value=lvalue)
     be_node_plus = ast.BinaryExpression(op=operator, lhs=int_node, rhs=i_node)
@@ -133,13 +153,14 @@ def test_visit_BinaryExpression_booleans(
         (ast.UnaryOperator["~"], -5, 4),
     ],
 )
-def test_visit_UnaryExpression(operator: ast.UnaryOperator, expected, val):
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_UnaryExpression(
+    operator: ast.UnaryOperator,
+    expected,
+    val,
+    interp: Interpreter,
+    activation_record: ActivationRecord,
+):
     activation_record.members["a"] = val
-    interp.call_stack.push(activation_record)
     i_node = ast.Identifier("a")
     u_node = ast.UnaryExpression(op=operator, expression=i_node)
     assert interp.visit_UnaryExpression(u_node) == expected
@@ -189,13 +210,10 @@ def test_ArrayLiteral():
     )
 
 
-def test_visit_IndexExpression():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_IndexExpression(
+    interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members["a"] = np.array([1, 2, 3, 4])
-    interp.call_stack.push(activation_record)
     i_node = ast.Identifier(name="a")
     int_node = ast.IntegerLiteral(value=1)
     ie_node = ast.IndexExpression(collection=i_node, index=[int_node])
@@ -226,14 +244,9 @@ def test_visit_Concatenation():
     assert np.all(Interpreter().visit_Concatenation(con_node) == np.array([1, 2, 3, 4]))
 
 
-def test_visit_QuantumGate():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = Path(__file__).parent.parent / "qasm/interpreter/quantumgate.qasm"
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_QuantumGate(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("quantumgate.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -260,15 +273,9 @@ def test_visit_QuantumGate():
     pv.call_stack.pop()
 
 
-def test_visit_QuantumMeasurement():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = Path(__file__).parent.parent / "qasm/interpreter/quantummeasure.qasm"
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_QuantumMeasurement(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("quantummeasure.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -281,17 +288,9 @@ def test_visit_QuantumMeasurement():
     pv.call_stack.pop()
 
 
-def test_visit_QuantumMeasurementStatement():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = (
-        Path(__file__).parent.parent / "qasm/interpreter/quantummeasurestatement.qasm"
-    )
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_QuantumMeasurementStatement(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("quantummeasurestatement.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -305,15 +304,9 @@ def test_visit_QuantumMeasurementStatement():
     pv.call_stack.pop()
 
 
-def test_visit_QuantumReset():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = Path(__file__).parent.parent / "qasm/interpreter/quantumreset.qasm"
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_QuantumReset(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("quantumreset.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -355,12 +348,7 @@ def test_visit_QuantumReset():
         ),
     ],
 )
-def test_visit_ConstantDeclaration(init, expected):
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
-    interp.call_stack.push(activation_record)
+def test_visit_ConstantDeclaration(init, expected, interp: Interpreter):
     cd_node = ast.ConstantDeclaration(
         type=ast.ClassicalType(),
         identifier=ast.Identifier("a"),
@@ -372,13 +360,10 @@ def test_visit_ConstantDeclaration(init, expected):
     interp.call_stack.pop()
 
 
-def test_visit_ConstantDeclaration_identifier():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_ConstantDeclaration_identifier(
+    interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members["a"] = 1
-    interp.call_stack.push(activation_record)
     cd_node = ast.ConstantDeclaration(
         type=ast.ClassicalType(),
         identifier=ast.Identifier("b"),
@@ -389,12 +374,7 @@ def test_visit_ConstantDeclaration_identifier():
     interp.call_stack.pop()
 
 
-def test_visit_ConstantDeclaration_array():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
-    interp.call_stack.push(activation_record)
+def test_visit_ConstantDeclaration_array(interp: Interpreter):
     arr_node = ast.ArrayLiteral(
         values=[ast.IntegerLiteral(value=1), ast.IntegerLiteral(value=2)]
     )
@@ -426,7 +406,7 @@ def test_visit_CalibrationDefinition():
     assert interp.defcal_nodes["_ZN5dummy_PN0_QN1_$0_R1"].qubits[0].name == "$0"
 
 
-def test_visit_CalibrationStatement():
+def test_visit_CalibrationStatement(interp: Interpreter):
     cal_node = ast.CalibrationStatement(
         body=[
             ast.ConstantDeclaration(
@@ -445,11 +425,6 @@ def test_visit_CalibrationStatement():
             ),
         ]
     )
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
-    interp.call_stack.push(activation_record)
     interp.visit_CalibrationStatement(cal_node)
     assert interp.calibration_scope == {"a": 3, "b": 1}
 
@@ -470,15 +445,9 @@ def test_visit_WhileLoop():
     assert ar["i"] == 10
 
 
-def test_visit_ForInLoop():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = Path(__file__).parent.parent / "qasm/interpreter/forloop.qasm"
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_ForInLoop(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("forloop.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -489,7 +458,7 @@ def test_visit_ForInLoop():
     pv.call_stack.pop()
 
 
-def test_visit_AliasStatement():
+def test_visit_AliasStatement(interp: Interpreter):
     arr_1 = ast.ArrayLiteral(
         values=[ast.IntegerLiteral(value=1), ast.IntegerLiteral(value=2)]
     )
@@ -499,22 +468,14 @@ def test_visit_AliasStatement():
     con_node = ast.Concatenation(lhs=arr_1, rhs=arr_2)
     al_node = ast.AliasStatement(target=ast.Identifier("a"), value=con_node)
 
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
-    interp.call_stack.push(activation_record)
     interp.visit_AliasStatement(al_node)
     assert np.all(interp.call_stack.peek().members["a"] == np.array([1, 2, 3, 4]))
 
 
-def test_visit_AliasStatement_identifier():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_AliasStatement_identifier(
+    interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members["my_arr"] = np.array([1, 2])
-    interp.call_stack.push(activation_record)
     arr_2 = ast.ArrayLiteral(
         values=[ast.IntegerLiteral(value=3), ast.IntegerLiteral(value=4)]
     )
@@ -564,13 +525,10 @@ def test_visit_DiscreteSet():
         ),
     ],
 )
-def test_visit_ClassicalAssignment(rval, original, expected):
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_ClassicalAssignment(
+    rval, original, expected, interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members = {"a": original}
-    interp.call_stack.push(activation_record)
     int_node = ast.ClassicalAssignment(
         op=ast.AssignmentOperator["="],
         lvalue=ast.Identifier("a"),
@@ -581,14 +539,11 @@ def test_visit_ClassicalAssignment(rval, original, expected):
     assert interp.call_stack.peek().members["a"] == expected
 
 
-def test_visit_ClassicalAssignment_identifier():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_visit_ClassicalAssignment_identifier(
+    interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members["a"] = 1
     activation_record.members["b"] = 2
-    interp.call_stack.push(activation_record)
     int_node = ast.ClassicalAssignment(
         op=ast.AssignmentOperator["="],
         lvalue=ast.Identifier("a"),
@@ -599,16 +554,13 @@ def test_visit_ClassicalAssignment_identifier():
     assert interp.call_stack.peek().members["b"] == 2
 
 
-def test_ClassicalAssignment_array():
-    interp = Interpreter()
-    activation_record = ActivationRecord(
-        name="main", ar_type=ARType.PROGRAM, nesting_level=1
-    )
+def test_ClassicalAssignment_array(
+    interp: Interpreter, activation_record: ActivationRecord
+):
     activation_record.members["a"] = np.array([3, 4])
     arr_node = ast.ArrayLiteral(
         values=[ast.IntegerLiteral(value=1), ast.IntegerLiteral(value=2)]
     )
-    interp.call_stack.push(activation_record)
     ca_node = ast.ClassicalAssignment(
         op=ast.AssignmentOperator["="],
         lvalue=ast.Identifier("a"),
@@ -632,17 +584,9 @@ def test_ClassicalAssignment_array():
 #         assert len(w) == 1
 
 
-def test_visit_FunctionCall():
-    setup_path = Path(__file__).parent.parent / "setups/basic.json"
-    qasm_path = (
-        Path(__file__).parent.parent / "qasm/interpreter/nested_subroutines.qasm"
-    )
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_FunctionCall(load_setup: Callable[[str], SetupInternal]):
+    qasm_ast = prepare_program("nested_subroutines.qasm")
+    pv = Interpreter(load_setup("basic.json"), waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
@@ -653,15 +597,9 @@ def test_visit_FunctionCall():
     pv.call_stack.pop()
 
 
-def test_visit_FunctionCall_phase_and_freq():
-    setup_path = Path(__file__).parent.parent / "setups/complex.json"
-    qasm_path = Path(__file__).parent.parent / "qasm/interpreter/phase_freq.qasm"
-    compiler = Compiler(qasm_path, setup_path)
-    qasm_ast = compiler.load_program(qasm_path)
-    ResolveIODeclaration().visit(qasm_ast)
-    SemanticAnalyzer().visit(qasm_ast)
-    DurationTransformer().visit(qasm_ast)
-    pv = Interpreter(SetupInternal.from_json(setup_path), waveform_functions.__dict__)
+def test_visit_FunctionCall_phase_and_freq(complex_setup: SetupInternal):
+    qasm_ast = prepare_program("phase_freq.qasm")
+    pv = Interpreter(complex_setup, waveform_functions.__dict__)
     activation_record = ActivationRecord(
         name="main", ar_type=ARType.PROGRAM, nesting_level=1
     )
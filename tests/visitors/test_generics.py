@@ -138,3 +138,59 @@ def test_generic_visitor_file_visit(qasm_path: Path):
     original = dumps(qasm_ast)
     copied = dumps(copy_ast)
     assert original == copied
+
+
+def test_generic_transformer_dispatch_cache():
+    class IdentifierRenamer(GenericTransformer):
+        def visit_Identifier(self, node: ast.Identifier, context=None):
+            return ast.Identifier(name=f"{node.name}_renamed")
+
+    def expression():
+        return ast.BinaryExpression(
+            op=ast.BinaryOperator["+"],
+            lhs=ast.Identifier("a"),
+            rhs=ast.Identifier("b"),
+        )
+
+    renamed = IdentifierRenamer().visit(expression())
+    assert renamed.lhs.name == "a_renamed"
+    assert renamed.rhs.name == "b_renamed"
+
+    unchanged = GenericTransformer().visit(expression())
+    assert unchanged.lhs.name == "a"
+    assert unchanged.rhs.name == "b"
+
+    assert IdentifierRenamer._visitor_cache is not GenericTransformer._visitor_cache
+    assert (
+        IdentifierRenamer._visitor_cache[ast.Identifier]
+        is IdentifierRenamer.visit_Identifier
+    )
+    assert (
+        GenericTransformer._visitor_cache[ast.Identifier]
+        is GenericTransformer.visit_Identifier
+    )
+
+
+def test_generic_visitor_dispatch_cache():
+    class IdentifierCollector(GenericVisitor):
+        def __init__(self) -> None:
+            self.names = []
+
+        def visit_Identifier(self, node: ast.Identifier, context=None):
+            self.names.append(node.name)
+
+    collector = IdentifierCollector()
+    collector.visit(
+        ast.BinaryExpression(
+            op=ast.BinaryOperator["+"],
+            lhs=ast.Identifier("a"),
+            rhs=ast.Identifier("b"),
+        )
+    )
+    assert collector.names == ["a", "b"]
+
+    assert IdentifierCollector._visitor_cache is not GenericVisitor._visitor_cache
+    assert (
+        IdentifierCollector._visitor_cache[ast.Identifier]
+        is IdentifierCollector.visit_Identifier
+    )